@@ -1,4 +1,5 @@
 import json
+import sys
 
 # JSONファイルからデータを読み込む
 station_connections = {
@@ -29,15 +30,25 @@ station_connections = {
     "和歌山": ["高田", "天王寺"]
 };
 
+# <option>タグの書式（値と表示名は同じ）
+OPTION_TEMPLATE = '<option value="%s - %s">%s - %s</option>'
+
 # すべての区間を出力するプログラム
-print("All Sections:")
-printed_sections = set()  # 既に出力した区間を記録するセット
+lines = ["All Sections:"]  # 出力する行をまとめておくリスト
+station_ids = {name: i for i, name in enumerate(station_connections)}  # 駅名を整数IDに変換
+printed_sections = set()  # 既に出力した区間を記録するセット（小さいID << 16 | 大きいID）
 
 for start_station, destinations in station_connections.items():
+    start_id = station_ids[start_station]
     for end_station in destinations:
+        end_id = station_ids.setdefault(end_station, len(station_ids))  # 接続先にしか出てこない駅にもIDを振る
+        # 向きに関係なく同じ区間を同じキーにする（2つのIDを1つの整数にまとめる）
+        section = start_id << 16 | end_id if start_id < end_id else end_id << 16 | start_id
         # 始点と終点が同じでなく、まだ出力されていない場合のみ出力
-        if start_station != end_station and (start_station, end_station) not in printed_sections:
-            print('<option value="'f'{start_station} - {end_station}''">'f'{start_station} - {end_station}''</option>')
-            printed_sections.add((start_station, end_station))
-            printed_sections.add((end_station, start_station))  # 入れ替えた方向も記録
+        if start_id != end_id and section not in printed_sections:
+            lines.append(OPTION_TEMPLATE % (start_station, end_station, start_station, end_station))
+            printed_sections.add(section)
 
+# まとめて一度に出力する
+sys.stdout.write("\n".join(lines))
+sys.stdout.write("\n")